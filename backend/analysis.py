@@ -13,16 +13,28 @@ from typing import Dict, Any
 def _series_to_bool_employed(df: pd.DataFrame) -> pd.Series:
     """
     Returns a boolean Series 'is_employed' regardless of source schema.
+      - If a precomputed '_is_employed' column exists (added at load time),
+        return it as-is.
       - If 'Employed' exists: treat 1/True as employed.
       - Else if 'EmploymentStatus' exists: treat 'Employed' (case-insensitive) as employed.
       - Else: all False.
     """
+    if "_is_employed" in df.columns:
+        # Normalized once at load (see main._load_dataframe); no string work here.
+        return df["_is_employed"].astype(bool)
+
     if "Employed" in df.columns:
-        # Coerce to int/bool, then True if == 1
-        try:
-            return (df["Employed"].astype("Int64").fillna(0) == 1)
-        except Exception:
-            return df["Employed"].astype(bool).fillna(False)
+        # Dispatch on dtype up front: already-bool/numeric columns skip the
+        # to_numeric parse, and the comparison runs on a raw ndarray rather
+        # than nullable extension-array machinery.
+        s = df["Employed"]
+        if pd.api.types.is_bool_dtype(s):
+            return pd.Series(s.fillna(False).to_numpy(dtype=bool), index=df.index, copy=False)
+        if pd.api.types.is_numeric_dtype(s):
+            arr = s.to_numpy(dtype="float64", na_value=0.0)
+        else:
+            arr = pd.to_numeric(s, errors="coerce").fillna(0).to_numpy()
+        return pd.Series(arr == 1, index=df.index, copy=False)
 
     if "EmploymentStatus" in df.columns:
         return df["EmploymentStatus"].astype(str).str.lower().eq("employed")
@@ -30,8 +42,11 @@ def _series_to_bool_employed(df: pd.DataFrame) -> pd.Series:
     return pd.Series([False] * len(df), index=df.index)
 
 
-def _safe_median(series: pd.Series) -> float | None:
-    s = pd.to_numeric(series, errors="coerce").dropna()
+def _safe_median(series: pd.Series | None) -> float | None:
+    """Median of an already-numeric Series, ignoring NaNs; None if empty."""
+    if series is None:
+        return None
+    s = series.dropna()
     return float(s.median()) if len(s) else None
 
 
@@ -61,43 +76,89 @@ def compute_summary(df: pd.DataFrame) -> Dict[str, Any]:
 
     is_emp = _series_to_bool_employed(df)
 
+    # Coerce Salary to numeric once; every consumer below reuses this Series
+    # instead of re-parsing the column per group.
+    salary_num = (
+        pd.to_numeric(df["Salary"], errors="coerce") if "Salary" in df.columns else None
+    )
+
     total = len(df)
     employed_count = int(is_emp.sum())
     employment_rate = (employed_count / total * 100.0) if total else 0.0
 
-    median_salary = _safe_median(df.get("Salary"))
+    median_salary = _safe_median(salary_num)
+
+    # Shared working frame: the employment flag and numeric Salary are
+    # attached once and reused by both the program and sector blocks.
+    base = df.assign(
+        _emp=is_emp.astype("int8"),
+        _sal=salary_num if salary_num is not None else float("nan"),
+    )
 
-    # By Program: employment rate & median salary
+    # By Program: employment rate & median salary.
+    # All three per-program stats (count, rate, median) come out of a single
+    # groupby().agg() pass over the frame; the employment mask and numeric
+    # Salary are the whole-frame versions computed above.
     by_program = []
     if "Program" in df.columns:
-        for prog, sub in df.groupby("Program"):
-            sub_emp = _series_to_bool_employed(sub)
-            rate = (float(sub_emp.mean()) * 100.0) if len(sub) else 0.0
-            med_sal = _safe_median(sub.get("Salary"))
-            by_program.append(
-                {
-                    "program": str(prog),
-                    "count": int(len(sub)),
-                    "employment_rate_pct": round(rate, 2),
-                    "median_salary_inr": None if med_sal is None else int(med_sal),
-                }
+        agg_df = (
+            # observed=True: with a categorical Program column, don't
+            # materialize zero-row groups for every unused category.
+            base.groupby("Program", sort=False, observed=True)
+            .agg(count=("_emp", "size"), rate=("_emp", "mean"), med=("_sal", "median"))
+            .sort_values("rate", ascending=False)
+        )
+        by_program = [
+            {
+                "program": str(prog),
+                "count": int(cnt),
+                "employment_rate_pct": round(float(rate) * 100.0, 2),
+                "median_salary_inr": None if pd.isna(med) else int(med),
+            }
+            for prog, cnt, rate, med in zip(
+                agg_df.index,
+                agg_df["count"].tolist(),
+                agg_df["rate"].tolist(),
+                agg_df["med"].tolist(),
             )
-        # Sort by employment rate desc
-        by_program.sort(key=lambda r: r["employment_rate_pct"], reverse=True)
+        ]
 
-    # By Sector counts (only for employed rows)
+    # By Sector counts (only for employed rows). Computed independently of
+    # Program: a (Program, Sector) groupby would drop rows whose Program is
+    # NaN (pandas discards NaN group keys), losing their sectors entirely.
+    # Single ndarray AND instead of a fillna/replace/dropna chain, which
+    # rewrote the column twice before counting.
     by_sector_counts = []
     if "Sector" in df.columns:
-        sector_counts = df.loc[is_emp, "Sector"].fillna("").replace("", pd.NA).dropna().value_counts()
-        for sector, cnt in sector_counts.items():
-            by_sector_counts.append({"sector": str(sector), "count": int(cnt)})
+        sector = df["Sector"]
+        mask = (
+            is_emp.to_numpy()
+            & sector.notna().to_numpy()
+            & sector.ne("").to_numpy()
+        )
+        vc = sector[mask].value_counts()
+        by_sector_counts = (
+            # drop zero-count entries a categorical dtype would report
+            vc[vc > 0]
+            .rename_axis("sector")
+            .reset_index(name="count")
+            .astype({"sector": str, "count": int})
+            .to_dict("records")
+        )
 
     # Top support services
     top_support = []
     if "SupportService" in df.columns:
-        svc_counts = df["SupportService"].fillna("").replace("", pd.NA).dropna().value_counts()
-        for svc, cnt in svc_counts.head(10).items():
-            top_support.append({"service": str(svc), "count": int(cnt)})
+        svc_vc = df["SupportService"].replace("", pd.NA).dropna().value_counts()
+        top_support = (
+            # drop zero-count entries a categorical dtype would report
+            svc_vc[svc_vc > 0]
+            .head(10)
+            .rename_axis("service")
+            .reset_index(name="count")
+            .astype({"service": str, "count": int})
+            .to_dict("records")
+        )
 
     out.update(
         {
@@ -8,18 +8,24 @@ Hybrid Q&A agent over the career dataset.
 
 from __future__ import annotations
 import os
+import threading
+from dataclasses import dataclass
+from collections import OrderedDict
+
 import pandas as pd
 
+from backend.analysis import _series_to_bool_employed
+
 _USE_GEMINI = False
 _MODEL = None
 _listed_models = []
 
 def _employment_rate(df: pd.DataFrame) -> float:
-    if "Employed" in df.columns and len(df) > 0:
-        return float((df["Employed"].astype("Int64").fillna(0) == 1).mean() * 100.0)
-    if "EmploymentStatus" in df.columns and len(df) > 0:
-        return float(df["EmploymentStatus"].astype(str).str.lower().eq("employed").mean() * 100.0)
-    return 0.0
+    # Reuse the schema-aware mask from analysis.py: one dtype dispatch,
+    # same Employed/EmploymentStatus handling as compute_summary.
+    if len(df) == 0:
+        return 0.0
+    return float(_series_to_bool_employed(df).mean() * 100.0)
 
 def _median_salary(df: pd.DataFrame):
     if "Salary" in df.columns:
@@ -33,84 +39,112 @@ def _top_sector(df: pd.DataFrame):
         if len(s): return str(s.mode().iloc[0])
     return None
 
+@dataclass(frozen=True)
+class DatasetStats:
+    """Dataset-level stats that are invariant for a loaded frame."""
+    n: int
+    emp_rate: float
+    median_salary: float | None
+    top_sector: str | None
+
+# Stats are computed once per loaded frame; every request after that is an
+# O(1) attribute lookup rather than a full-frame scan.
+_stats_cache: tuple[int, DatasetStats] | None = None
+
+def _get_stats(df: pd.DataFrame) -> DatasetStats:
+    global _stats_cache
+    if _stats_cache is not None and _stats_cache[0] == id(df):
+        return _stats_cache[1]
+    stats = DatasetStats(
+        n=len(df),
+        emp_rate=_employment_rate(df),
+        median_salary=_median_salary(df),
+        top_sector=_top_sector(df),
+    )
+    _stats_cache = (id(df), stats)
+    return stats
+
 def _rule_based_answer(question: str, df: pd.DataFrame) -> str:
+    stats = _get_stats(df)
     q = (question or "").lower().strip()
     if any(k in q for k in ["employ", "placement", "placed"]):
-        return f"Estimated employment rate is {_employment_rate(df):.1f}% (n={len(df)} records)."
+        return f"Estimated employment rate is {stats.emp_rate:.1f}% (n={stats.n} records)."
     if any(k in q for k in ["salary", "package", "ctc"]):
-        med = _median_salary(df)
+        med = stats.median_salary
         return f"The median salary is about ₹{med:,.0f}." if med is not None else "I don't have salary data available."
     if any(k in q for k in ["sector", "industry", "field"]):
-        top = _top_sector(df)
+        top = stats.top_sector
         return f"The most common hiring sector appears to be {top}." if top else "I don't have sector data available."
     return ("Try asking: 'What is the employment rate?', "
             "'What is the median salary?', or 'Which sector hires most graduates?'")
 
 # ---------- Gemini setup with auto model discovery ----------
+# Importing/configuring the SDK here is cheap; the model *lookup* is a
+# blocking list_models HTTPS call, so it's deferred to the first /ask
+# request instead of serializing server startup behind network I/O.
 try:
     import google.generativeai as genai
     _API_KEY = os.getenv("GEMINI_API_KEY")
     if _API_KEY:
         genai.configure(api_key=_API_KEY)
-
-        def _pick_model() -> str:
-            # Allow manual override
-            forced = os.getenv("GEMINI_MODEL")
-            if forced:
-                return forced
-
-            # List available models and pick one that supports generateContent
-            models = list(genai.list_models())
-            # keep for debugging if needed
-            global _listed_models
-            _listed_models = [m.name for m in models]
-
-            def supports(m, method="generateContent"):
-                try:
-                    return method in getattr(m, "supported_generation_methods", [])
-                except Exception:
-                    return False
-
-            # preference order
-            preferred = [
-                "gemini-1.5-flash-latest",
-                "gemini-1.5-flash",
-                "gemini-1.5-pro-latest",
-                "gemini-1.5-pro",
-                "gemini-pro",  # older
-            ]
-            names = {m.name for m in models if supports(m)}
-            for p in preferred:
-                if p in names:
-                    return p
-            # fallback: any model that supports generateContent
-            if names:
-                return sorted(names)[0]
-            raise RuntimeError("No Gemini models supporting generateContent are available for this key/account.")
-
-        model_name = _pick_model()
-        _MODEL = genai.GenerativeModel(model_name)
         _USE_GEMINI = True
-    else:
-        _USE_GEMINI = False
 except Exception:
     _USE_GEMINI = False
 
-# ---------- Main answer function ----------
-def answer_question(question: str, df: pd.DataFrame) -> str:
-    if not _USE_GEMINI or _MODEL is None:
-        return _rule_based_answer(question, df)
+_MODEL_LOCK = threading.Lock()
+_MODEL_RESOLVED = False
+
+def _pick_model() -> str:
+    # Allow manual override
+    forced = os.getenv("GEMINI_MODEL")
+    if forced:
+        return forced
+
+    # List available models and pick one that supports generateContent
+    models = list(genai.list_models())
+    # keep for debugging if needed
+    global _listed_models
+    _listed_models = [m.name for m in models]
+
+    def supports(m, method="generateContent"):
+        try:
+            return method in getattr(m, "supported_generation_methods", [])
+        except Exception:
+            return False
+
+    # preference order
+    preferred = [
+        "gemini-1.5-flash-latest",
+        "gemini-1.5-flash",
+        "gemini-1.5-pro-latest",
+        "gemini-1.5-pro",
+        "gemini-pro",  # older
+    ]
+    names = {m.name for m in models if supports(m)}
+    for p in preferred:
+        if p in names:
+            return p
+    # fallback: any model that supports generateContent
+    if names:
+        return sorted(names)[0]
+    raise RuntimeError("No Gemini models supporting generateContent are available for this key/account.")
+
+def _get_model():
+    """Resolve the Gemini model lazily; None if Gemini isn't usable."""
+    global _MODEL, _MODEL_RESOLVED
+    if _MODEL_RESOLVED:
+        return _MODEL
+    with _MODEL_LOCK:
+        if not _MODEL_RESOLVED:
+            try:
+                _MODEL = genai.GenerativeModel(_pick_model())
+            except Exception:
+                _MODEL = None
+            _MODEL_RESOLVED = True
+    return _MODEL
 
-    try:
-        parts = [f"Total records: {len(df)}",
-                 f"Employment rate: {_employment_rate(df):.1f}%"]
-        med = _median_salary(df)
-        if med is not None: parts.append(f"Median salary: ₹{med:,.0f}")
-        top = _top_sector(df)
-        if top: parts.append(f"Top hiring sector: {top}")
-        summary = "\n".join(parts)
-
-        prompt = f"""
+# ---------- Main answer function ----------
+_PROMPT_TEMPLATE = """
 You are an assistant answering parent-style questions about graduates' career outcomes.
 Be concise, numerical, and clear.
 
@@ -119,9 +153,73 @@ Dataset summary:
 
 Question: {question}
 """
-        resp = _MODEL.generate_content(prompt)
+
+# The dataset summary never changes for a given df, so build it once and
+# reuse it on every /ask call instead of re-scanning the frame per request.
+_summary_cache: tuple[int, str] | None = None
+
+def _dataset_summary(df: pd.DataFrame) -> str:
+    global _summary_cache
+    if _summary_cache is not None and _summary_cache[0] == id(df):
+        return _summary_cache[1]
+    stats = _get_stats(df)
+    parts = [f"Total records: {stats.n}",
+             f"Employment rate: {stats.emp_rate:.1f}%"]
+    if stats.median_salary is not None: parts.append(f"Median salary: ₹{stats.median_salary:,.0f}")
+    if stats.top_sector: parts.append(f"Top hiring sector: {stats.top_sector}")
+    summary = "\n".join(parts)
+    _summary_cache = (id(df), summary)
+    return summary
+
+# Demo traffic repeats the same handful of questions, so answers are cached
+# keyed by (normalized question, data version). The version token bumps
+# whenever a different frame is passed in, invalidating old entries; cache
+# hits also skip the Gemini round-trip, the dominant cost per request.
+# Fallback answers produced by a Gemini *failure* are never cached, so a
+# transient error can't pin a degraded answer for the process lifetime.
+_ACTIVE_DF: pd.DataFrame | None = None
+_DATA_VERSION = 0
+_ANSWER_CACHE: OrderedDict[tuple[str, int], str] = OrderedDict()
+_ANSWER_CACHE_MAX = 512
+
+def _data_version_for(df: pd.DataFrame) -> int:
+    global _ACTIVE_DF, _DATA_VERSION
+    if df is not _ACTIVE_DF:
+        _ACTIVE_DF = df
+        _DATA_VERSION += 1
+    return _DATA_VERSION
+
+def answer_question(question: str, df: pd.DataFrame) -> str:
+    # Normalization is for the cache key only; the prompt gets the original.
+    key = ((question or "").lower().strip(), _data_version_for(df))
+    cached = _ANSWER_CACHE.get(key)
+    if cached is not None:
+        _ANSWER_CACHE.move_to_end(key)
+        return cached
+    answer, cacheable = _answer_uncached(question, df)
+    if cacheable:
+        _ANSWER_CACHE[key] = answer
+        if len(_ANSWER_CACHE) > _ANSWER_CACHE_MAX:
+            _ANSWER_CACHE.popitem(last=False)
+    return answer
+
+def _answer_uncached(question: str, df: pd.DataFrame) -> tuple[str, bool]:
+    """
+    Returns (answer, cacheable). Answers are cacheable when they are real
+    LLM output or the deterministic no-Gemini response; fallbacks caused by
+    a Gemini error or empty reply are not.
+    """
+    model = _get_model() if _USE_GEMINI else None
+    if model is None:
+        return _rule_based_answer(question, df), True
+
+    try:
+        prompt = _PROMPT_TEMPLATE.format(summary=_dataset_summary(df), question=question)
+        resp = model.generate_content(prompt)
         txt = (getattr(resp, "text", None) or "").strip()
-        return txt or _rule_based_answer(question, df)
+        if txt:
+            return txt, True
+        return _rule_based_answer(question, df), False
     except Exception as e:
         # graceful fallback
-        return _rule_based_answer(question, df)
+        return _rule_based_answer(question, df), False
@@ -1,10 +1,15 @@
 # backend/main.py
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import orjson
 from pydantic import BaseModel
-import pandas as pd
+import functools
+import hashlib
 import os
 
+import pandas as pd
+
 from backend.analysis import compute_summary
 from backend.llm_agent import answer_question
 
@@ -18,6 +23,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,  # orjson also handles numpy scalars
 )
 
 # -----------------------------------------------------------------------------
@@ -70,33 +76,123 @@ DATA_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "data", "career_data.csv")
 )
 
+# Parquet cache written next to the CSV; loading it on warm starts skips the
+# CSV parse entirely (columnar decode, native dtypes).
+CACHE_PATH = DATA_PATH + ".parquet"
+
+# Columns the API actually uses, with explicit dtypes so read_csv skips its
+# type-inference pass and the frame stays compact (categories group by
+# integer codes downstream).
+EXPECTED_COLUMNS = ["Employed", "EmploymentStatus", "Salary", "Sector", "SupportService", "Program"]
+CSV_DTYPES = {
+    "Employed": "Int8",
+    "Salary": "float64",
+    "Program": "category",
+    "Sector": "category",
+    "SupportService": "category",
+}
+
+def _read_csv_with_cache() -> pd.DataFrame:
+    if os.path.exists(CACHE_PATH) and os.path.getmtime(CACHE_PATH) >= os.path.getmtime(DATA_PATH):
+        try:
+            return pd.read_parquet(CACHE_PATH)
+        except Exception as e:
+            # Stale/unreadable cache: fall through to the CSV
+            print(f"[WARN] Failed reading parquet cache: {e}")
+    # Resolve usecols against the actual header (cheap: zero data rows) so
+    # the list form works with both engines regardless of missing columns.
+    header = pd.read_csv(DATA_PATH, nrows=0).columns
+    usecols = [c for c in header if c in EXPECTED_COLUMNS]
+    dtypes = {c: t for c, t in CSV_DTYPES.items() if c in usecols}
+    try:
+        try:
+            # pyarrow's CSV reader is multithreaded and SIMD-accelerated
+            df = pd.read_csv(DATA_PATH, usecols=usecols, dtype=dtypes, engine="pyarrow")
+        except (ImportError, TypeError, ValueError):
+            # pyarrow or engine support missing: the C engine reads the same way
+            df = pd.read_csv(DATA_PATH, usecols=usecols, dtype=dtypes)
+    except ValueError as e:
+        # Data doesn't fit the expected dtypes (e.g. Employed="Yes"/"No"):
+        # keep the API alive by re-reading with inferred types.
+        print(f"[WARN] CSV didn't match expected dtypes ({e}); re-reading with inferred types")
+        df = pd.read_csv(DATA_PATH, usecols=usecols)
+    try:
+        df.to_parquet(CACHE_PATH)
+    except Exception as e:
+        # pyarrow/fastparquet missing or dir read-only; CSV path still works
+        print(f"[WARN] Could not write parquet cache: {e}")
+    return df
+
 def _load_dataframe() -> pd.DataFrame:
     if os.path.exists(DATA_PATH):
         try:
-            df = pd.read_csv(DATA_PATH)
+            df = _read_csv_with_cache()
             # Normalize expected columns if needed (safe defaults)
             # Expected by analysis.py: columns like Employed/EmploymentStatus, Salary, Sector, SupportService, Program
             # Create missing columns if absent to avoid crashes
-            for col in ["Employed", "EmploymentStatus", "Salary", "Sector", "SupportService", "Program"]:
+            for col in EXPECTED_COLUMNS:
                 if col not in df.columns:
                     df[col] = pd.Series(dtype="object")
+            # Category dtype lets downstream groupby/value_counts hash 8-byte
+            # integer codes instead of strings. The CSV reader already asks
+            # for category; this also covers the parquet-cache path and
+            # caches written before the dtype map existed. Safe memory-wise
+            # because analysis.py always groups with observed=True.
+            for col in ("Program", "Sector", "SupportService"):
+                if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].astype("category")
+            # Pre-normalize EmploymentStatus once at load: lowering strings is
+            # the slow per-row step, so it runs here instead of on every
+            # request. _series_to_bool_employed picks this column up directly.
+            has_employed = "Employed" in df.columns and df["Employed"].notna().any()
+            if not has_employed and "EmploymentStatus" in df.columns and df["EmploymentStatus"].notna().any():
+                df["_is_employed"] = (
+                    df["EmploymentStatus"]
+                    .astype("string")
+                    .str.casefold()
+                    .eq("employed")
+                    .fillna(False)
+                    .astype(bool)
+                    .to_numpy()
+                )
             return df
         except Exception as e:
             # If CSV is corrupt, return empty frame to keep API alive
             print(f"[WARN] Failed reading CSV: {e}")
-            return pd.DataFrame(columns=["Employed", "EmploymentStatus", "Salary", "Sector", "SupportService", "Program"])
+            return pd.DataFrame(columns=EXPECTED_COLUMNS)
     else:
         print(f"[WARN] Data file not found at {DATA_PATH}. Serving empty dataset.")
-        return pd.DataFrame(columns=["Employed", "EmploymentStatus", "Salary", "Sector", "SupportService", "Program"])
+        return pd.DataFrame(columns=EXPECTED_COLUMNS)
+
+# Cached accessors: whatever imports this module (uvicorn workers, tests,
+# re-imports under different names) shares one loaded frame and one computed
+# summary instead of repeating the O(N) load per call site.
+@functools.cache
+def get_df() -> pd.DataFrame:
+    return _load_dataframe()
+
+@functools.cache
+def get_summary() -> dict:
+    try:
+        return compute_summary(get_df())
+    except Exception as e:
+        print(f"[WARN] compute_summary failed: {e}")
+        return {"records": 0, "employment_rate": 0.0, "avg_salary": 0.0, "by_sector": {}, "support_usage": {}}
+
+# The summary is immutable after load, so serialize it once; /statistics
+# then only has to write the prebuilt bytes to the socket.
+@functools.cache
+def get_summary_bytes() -> bytes:
+    return orjson.dumps(get_summary(), option=orjson.OPT_SERIALIZE_NUMPY)
 
-df: pd.DataFrame = _load_dataframe()
+@functools.cache
+def get_summary_etag() -> str:
+    # RFC 7232 entity-tags are quoted strings
+    return '"' + hashlib.md5(get_summary_bytes()).hexdigest() + '"'
 
-# Precompute summary at startup (fast)
-try:
-    summary_cache = compute_summary(df)
-except Exception as e:
-    print(f"[WARN] compute_summary failed: {e}")
-    summary_cache = {"records": 0, "employment_rate": 0.0, "avg_salary": 0.0, "by_sector": {}, "support_usage": {}}
+# Warm the caches at import so the first request doesn't pay the load cost.
+df: pd.DataFrame = get_df()
+get_summary_bytes()
 
 # -----------------------------------------------------------------------------
 # Schemas
@@ -108,11 +204,30 @@ class Question(BaseModel):
 # API routes
 # -----------------------------------------------------------------------------
 @app.get("/statistics", tags=["analytics"])
-def get_statistics():
+def get_statistics(request: Request):
     """
     Returns cached analytics summary computed from the CSV.
+    The payload is serialized once at startup; see get_summary_bytes().
+    The payload never changes within a process, so clients that present a
+    matching ETag get an empty 304 instead of the full body.
     """
-    return summary_cache
+    etag = get_summary_etag()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    # If-None-Match may list several tags and/or weak validators; compare
+    # on the unquoted opaque values. A 304 carries the same caching headers.
+    if_none_match = request.headers.get("if-none-match", "")
+    client_tags = {
+        t.strip().removeprefix("W/").strip('"')
+        for t in if_none_match.split(",")
+        if t.strip()
+    }
+    if etag.strip('"') in client_tags or "*" in client_tags:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        get_summary_bytes(),
+        media_type="application/json",
+        headers=headers,
+    )
 
 @app.post("/ask", tags=["qa"])
 def ask_question(q: Question):